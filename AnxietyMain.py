@@ -1,12 +1,32 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
 from datetime import datetime
+from collections import defaultdict
+import csv
 import os
 
+COLUMNS = (
+    'timestamp', 'food_source', 'eating_location', 'anxiety_level',
+    'breathing_difficulty', 'swallowing_difficulty', 'scratchy_throat',
+    'stomach_pain', 'chest_pain', 'reflux', 'food_eaten', 'concerns',
+    'additional_comments', 'took_meds', 'med_types', 'meds_helped'
+)
+SEVERITY_COLS = (
+    'breathing_difficulty', 'swallowing_difficulty', 'scratchy_throat',
+    'stomach_pain', 'chest_pain', 'reflux'
+)
+SYMPTOM_LABELS = tuple(s.replace('_', ' ').title() for s in SEVERITY_COLS)
+SEVERITY_OPTIONS = ("None", "Mild", "Moderate", "Severe")
+SEVERITY_MAP = {s: i for i, s in enumerate(SEVERITY_OPTIONS)}
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+SEVERITY_DTYPE = pd.CategoricalDtype(SEVERITY_OPTIONS, ordered=True)
+
+# Above this many entries the time series is plotted as bucketed means
+RESAMPLE_THRESHOLD = 200
+RESAMPLE_RULES = {"Hour": "1h", "Day": "1D", "Week": "1W"}
+
 class FoodAnxietyApp:
     def __init__(self, root):
         self.root = root
@@ -15,7 +35,17 @@ class FoodAnxietyApp:
         
         # Data storage
         self.data_file = "food_anxiety_data.csv"
+        # An empty file (opened for append but never written) has no header yet
+        self._file_exists = os.path.exists(self.data_file) and os.path.getsize(self.data_file) > 0
         self.data = self.load_data()
+        self._rows = self.data.to_dict("records")
+        self._df_dirty = False
+        self.init_aggregates()
+        
+        # Keep the CSV open for appends for the life of the app
+        self._csv_fh = open(self.data_file, "a", newline="", buffering=1 << 16)
+        self._csv_writer = csv.DictWriter(self._csv_fh, fieldnames=COLUMNS)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Create notebook for tabs
         self.notebook = ttk.Notebook(root)
@@ -27,20 +57,85 @@ class FoodAnxietyApp:
         
     def load_data(self):
         """Load existing data or create empty DataFrame"""
-        if os.path.exists(self.data_file):
-            return pd.read_csv(self.data_file)
+        if self._file_exists:
+            try:
+                # pyarrow's multithreaded parser is much faster on long histories
+                df = pd.read_csv(self.data_file, engine="pyarrow")
+            except (ImportError, ValueError):
+                # No pyarrow, or a row it rejects (e.g. truncated by a crash mid-write)
+                df = pd.read_csv(self.data_file)
+            # Rows are appended in COLUMNS order, so the header has to match it exactly
+            if tuple(df.columns) != COLUMNS:
+                raise ValueError(f"{self.data_file} has columns {list(df.columns)}, expected {list(COLUMNS)}")
+            return self.set_column_dtypes(df)
         else:
-            columns = [
-                'timestamp', 'food_source', 'eating_location', 'anxiety_level',
-                'breathing_difficulty', 'swallowing_difficulty', 'scratchy_throat',
-                'stomach_pain', 'chest_pain', 'reflux', 'food_eaten', 'concerns',
-                'additional_comments', 'took_meds', 'med_types', 'meds_helped'
-            ]
-            return pd.DataFrame(columns=columns)
+            return self.set_column_dtypes(pd.DataFrame(columns=list(COLUMNS)))
+    
+    def set_column_dtypes(self, df):
+        """Parse timestamps, store severities and food/location as categoricals and med flags as bool"""
+        if 'timestamp' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format=TIMESTAMP_FORMAT, cache=True)
+        for col in SEVERITY_COLS:
+            if col in df.columns:
+                # Missing cells (read_csv parses "None" as NaN) mean no symptom
+                df[col] = df[col].astype(SEVERITY_DTYPE).fillna("None")
+        for col in ('food_source', 'eating_location'):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        for col in ('took_meds', 'meds_helped'):
+            if col in df.columns:
+                df[col] = df[col].fillna(False).astype(bool)
+        return df
+    
+    def init_aggregates(self):
+        """Compute running totals for the summary plots from the loaded data"""
+        data = self.data
+        # (N, 6) matrix of severity codes, summed in one pass
+        codes = np.stack([data[c].cat.codes.to_numpy() for c in SEVERITY_COLS], axis=1)
+        took = data['took_meds'].to_numpy(dtype=bool)
+        helped = data['meds_helped'].to_numpy(dtype=bool)
+        self._agg = {
+            "food_src": defaultdict(lambda: [0, 0]),
+            "sym_sum": codes.sum(axis=0, dtype=np.int64),
+            "sym_n": len(data),
+            "meds_took": int(took.sum()),
+            "meds_helped": int(np.logical_and(took, helped).sum()),
+        }
+        by_source = data.groupby('food_source', observed=True)['anxiety_level'].agg(['sum', 'count'])
+        for source, total, count in by_source.itertuples():
+            self._agg["food_src"][source] = [total, count]
+    
+    def update_aggregates(self, entry):
+        """Fold a newly submitted entry into the running totals"""
+        food_src = self._agg["food_src"][entry['food_source']]
+        food_src[0] += entry['anxiety_level']
+        food_src[1] += 1
+        self._agg["sym_sum"] += [SEVERITY_MAP[entry[c]] for c in SEVERITY_COLS]
+        self._agg["sym_n"] += 1
+        if entry['took_meds']:
+            self._agg["meds_took"] += 1
+            if entry['meds_helped']:
+                self._agg["meds_helped"] += 1
     
-    def save_data(self):
-        """Save data to CSV file"""
-        self.data.to_csv(self.data_file, index=False)
+    def refresh_data(self):
+        """Rebuild the DataFrame from buffered rows if new entries were submitted"""
+        if self._df_dirty:
+            self.data = self.set_column_dtypes(pd.DataFrame(self._rows, columns=list(COLUMNS)))
+            self._df_dirty = False
+    
+    def save_data(self, entry):
+        """Append a single entry to the CSV file"""
+        if not self._file_exists:
+            self._csv_writer.writeheader()
+            self._file_exists = True
+        self._csv_writer.writerow({**entry, 'timestamp': entry['timestamp'].strftime(TIMESTAMP_FORMAT)})
+        # Flush so a crash never loses a submitted entry
+        self._csv_fh.flush()
+    
+    def on_close(self):
+        """Close the CSV file and exit"""
+        self._csv_fh.close()
+        self.root.destroy()
     
     def create_data_entry_tab(self):
         """Create the data entry tab"""
@@ -73,6 +168,21 @@ class FoodAnxietyApp:
         self.took_meds = tk.BooleanVar(value=False)
         self.meds_helped = tk.BooleanVar(value=False)
         
+        # Variables read as-is on submit, keyed by column name
+        self._form_vars = {
+            'food_source': self.food_source,
+            'eating_location': self.eating_location,
+            'anxiety_level': self.anxiety_level,
+            'breathing_difficulty': self.breathing_difficulty,
+            'swallowing_difficulty': self.swallowing_difficulty,
+            'scratchy_throat': self.scratchy_throat,
+            'stomach_pain': self.stomach_pain,
+            'chest_pain': self.chest_pain,
+            'reflux': self.reflux,
+            'took_meds': self.took_meds,
+            'meds_helped': self.meds_helped
+        }
+        
         # Create form fields
         row = 0
         
@@ -101,8 +211,6 @@ class FoodAnxietyApp:
         row += 1
         
         # Symptom severity questions
-        severity_options = ["None", "Mild", "Moderate", "Severe"]
-        
         symptoms = [
             ("Difficulty catching breath?", self.breathing_difficulty),
             ("Difficulty swallowing?", self.swallowing_difficulty),
@@ -114,7 +222,7 @@ class FoodAnxietyApp:
         
         for symptom_text, symptom_var in symptoms:
             ttk.Label(scrollable_frame, text=symptom_text).grid(row=row, column=0, sticky='w', pady=5)
-            ttk.Combobox(scrollable_frame, textvariable=symptom_var, values=severity_options, state="readonly").grid(row=row, column=1, sticky='w', pady=5)
+            ttk.Combobox(scrollable_frame, textvariable=symptom_var, values=SEVERITY_OPTIONS, state="readonly").grid(row=row, column=1, sticky='w', pady=5)
             row += 1
         
         # Text fields
@@ -162,6 +270,25 @@ class FoodAnxietyApp:
         # Submit button
         ttk.Button(scrollable_frame, text="Submit Entry", command=self.submit_entry).grid(row=row, column=0, columnspan=2, pady=20)
         
+        # Default values restored by clear_form
+        self._defaults = [
+            (self.food_source, "Home"),
+            (self.eating_location, "Home"),
+            (self.anxiety_level, 0),
+            (self.breathing_difficulty, "None"),
+            (self.swallowing_difficulty, "None"),
+            (self.scratchy_throat, "None"),
+            (self.stomach_pain, "None"),
+            (self.chest_pain, "None"),
+            (self.reflux, "None"),
+            (self.took_meds, False),
+            (self.meds_helped, False),
+            (self.allergy_med, False),
+            (self.anxiety_med, False),
+            (self.other_med, False)
+        ]
+        self._text_widgets = [self.food_eaten, self.concerns, self.additional_comments]
+        
         # Pack canvas and scrollbar
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -178,51 +305,34 @@ class FoodAnxietyApp:
             med_types.append("Other")
         
         # Create new entry
-        new_entry = {
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'food_source': self.food_source.get(),
-            'eating_location': self.eating_location.get(),
-            'anxiety_level': self.anxiety_level.get(),
-            'breathing_difficulty': self.breathing_difficulty.get(),
-            'swallowing_difficulty': self.swallowing_difficulty.get(),
-            'scratchy_throat': self.scratchy_throat.get(),
-            'stomach_pain': self.stomach_pain.get(),
-            'chest_pain': self.chest_pain.get(),
-            'reflux': self.reflux.get(),
-            'food_eaten': self.food_eaten.get("1.0", tk.END).strip(),
-            'concerns': self.concerns.get("1.0", tk.END).strip(),
-            'additional_comments': self.additional_comments.get("1.0", tk.END).strip(),
-            'took_meds': self.took_meds.get(),
-            'med_types': ', '.join(med_types),
-            'meds_helped': self.meds_helped.get()
-        }
+        timestamp = datetime.now().replace(microsecond=0)
+        values = {k: v.get() for k, v in self._form_vars.items()}
+        values.update(
+            timestamp=timestamp,
+            food_eaten=self.food_eaten.get("1.0", tk.END).strip(),
+            concerns=self.concerns.get("1.0", tk.END).strip(),
+            additional_comments=self.additional_comments.get("1.0", tk.END).strip(),
+            med_types=', '.join(med_types)
+        )
+        new_entry = {col: values[col] for col in COLUMNS}
         
-        # Add to dataframe
-        self.data = pd.concat([self.data, pd.DataFrame([new_entry])], ignore_index=True)
-        self.save_data()
+        # Append to CSV first, then buffer the row; the DataFrame is rebuilt lazily
+        self.save_data(new_entry)
+        self._rows.append(new_entry)
+        self._df_dirty = True
+        self.update_aggregates(new_entry)
         
         messagebox.showinfo("Success", "Entry submitted successfully!")
         self.clear_form()
     
     def clear_form(self):
         """Clear all form fields"""
-        self.food_source.set("Home")
-        self.eating_location.set("Home")
-        self.anxiety_level.set(0)
-        self.breathing_difficulty.set("None")
-        self.swallowing_difficulty.set("None")
-        self.scratchy_throat.set("None")
-        self.stomach_pain.set("None")
-        self.chest_pain.set("None")
-        self.reflux.set("None")
-        self.took_meds.set(False)
-        self.meds_helped.set(False)
-        self.allergy_med.set(False)
-        self.anxiety_med.set(False)
-        self.other_med.set(False)
-        self.food_eaten.delete("1.0", tk.END)
-        self.concerns.delete("1.0", tk.END)
-        self.additional_comments.delete("1.0", tk.END)
+        for var, default in self._defaults:
+            var.set(default)
+        for widget in self._text_widgets:
+            # Skip boxes that are already empty
+            if widget.index("end-1c") != "1.0":
+                widget.delete("1.0", tk.END)
     
     def create_visualization_tab(self):
         """Create the visualization tab"""
@@ -238,37 +348,55 @@ class FoodAnxietyApp:
         self.viz_type = tk.StringVar(value="Anxiety Over Time")
         viz_options = ["Anxiety Over Time", "Symptom Severity", "Food Source Analysis", "Medication Effectiveness"]
         ttk.Combobox(control_frame, textvariable=self.viz_type, values=viz_options, state="readonly").pack(side='left', padx=10)
+        
+        # Bucket size for long anxiety histories
+        ttk.Label(control_frame, text="Bucket:").pack(side='left')
+        self.resample_rule = tk.StringVar(value="Hour")
+        ttk.Combobox(control_frame, textvariable=self.resample_rule, values=list(RESAMPLE_RULES), state="readonly", width=8).pack(side='left', padx=10)
         ttk.Button(control_frame, text="Generate Plot", command=self.generate_plot).pack(side='left', padx=10)
         
         # Plot frame
         self.plot_frame = ttk.Frame(viz_frame)
         self.plot_frame.pack(fill='both', expand=True, padx=10, pady=10)
+        
+        # Figure is created on the first plot so matplotlib isn't imported at startup
+        self._canvas = None
     
-    def severity_to_numeric(self, severity):
-        """Convert severity text to numeric value"""
-        mapping = {"None": 0, "Mild": 1, "Moderate": 2, "Severe": 3}
-        return mapping.get(severity, 0)
+    def create_plot_canvas(self):
+        """Embed a single figure that is reused for every plot"""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        
+        self._fig = Figure(figsize=(10, 6))
+        self._ax = self._fig.add_subplot()
+        self._canvas = FigureCanvasTkAgg(self._fig, master=self.plot_frame)
+        self._canvas.get_tk_widget().pack(fill='both', expand=True)
     
     def generate_plot(self):
         """Generate the selected visualization"""
-        if self.data.empty:
+        if not self._rows:
             messagebox.showwarning("No Data", "No data available for visualization. Please enter some data first.")
             return
         
         # Clear previous plot
-        for widget in self.plot_frame.winfo_children():
-            widget.destroy()
-        
-        # Convert timestamp to datetime
-        if 'timestamp' in self.data.columns:
-            self.data['timestamp'] = pd.to_datetime(self.data['timestamp'])
-        
-        fig, ax = plt.subplots(figsize=(10, 6))
+        if self._canvas is None:
+            self.create_plot_canvas()
+        ax = self._ax
+        ax.clear()
         
         viz_type = self.viz_type.get()
         
         if viz_type == "Anxiety Over Time":
-            if len(self.data) > 1:
+            self.refresh_data()
+            if len(self.data) > RESAMPLE_THRESHOLD:
+                rule = RESAMPLE_RULES[self.resample_rule.get()]
+                series = self.data.set_index('timestamp')['anxiety_level'].resample(rule).mean().dropna()
+                ax.plot(series.index, series.values, marker='.', linewidth=1)
+                ax.set_title(f'Anxiety Level Over Time ({self.resample_rule.get()} Average)')
+                ax.set_xlabel('Time')
+                ax.set_ylabel('Anxiety Level (0-10)')
+                ax.grid(True, alpha=0.3)
+            elif len(self.data) > 1:
                 ax.plot(self.data['timestamp'], self.data['anxiety_level'], marker='o')
                 ax.set_title('Anxiety Level Over Time')
                 ax.set_xlabel('Time')
@@ -279,50 +407,34 @@ class FoodAnxietyApp:
                        ha='center', va='center', transform=ax.transAxes)
         
         elif viz_type == "Symptom Severity":
-            symptoms = ['breathing_difficulty', 'swallowing_difficulty', 'scratchy_throat', 
-                       'stomach_pain', 'chest_pain', 'reflux']
-            
-            # Convert severity to numeric and calculate averages
-            severity_data = {}
-            for symptom in symptoms:
-                if symptom in self.data.columns:
-                    numeric_values = self.data[symptom].apply(self.severity_to_numeric)
-                    severity_data[symptom.replace('_', ' ').title()] = numeric_values.mean()
+            means = self._agg["sym_sum"] / self._agg["sym_n"]
             
-            if severity_data:
-                ax.bar(severity_data.keys(), severity_data.values())
-                ax.set_title('Average Symptom Severity')
-                ax.set_ylabel('Average Severity (0-3)')
-                ax.tick_params(axis='x', rotation=45)
+            ax.bar(range(len(SYMPTOM_LABELS)), means)
+            ax.set_xticks(range(len(SYMPTOM_LABELS)))
+            ax.set_xticklabels(SYMPTOM_LABELS, rotation=45)
+            ax.set_title('Average Symptom Severity')
+            ax.set_ylabel('Average Severity (0-3)')
         
         elif viz_type == "Food Source Analysis":
-            if 'food_source' in self.data.columns and 'anxiety_level' in self.data.columns:
-                food_anxiety = self.data.groupby('food_source')['anxiety_level'].mean()
-                ax.bar(food_anxiety.index, food_anxiety.values)
-                ax.set_title('Average Anxiety by Food Source')
-                ax.set_ylabel('Average Anxiety Level')
+            food_anxiety = {k: s / n for k, (s, n) in self._agg["food_src"].items()}
+            ax.bar(list(food_anxiety.keys()), list(food_anxiety.values()))
+            ax.set_title('Average Anxiety by Food Source')
+            ax.set_ylabel('Average Anxiety Level')
         
         elif viz_type == "Medication Effectiveness":
-            if 'took_meds' in self.data.columns and 'meds_helped' in self.data.columns:
-                med_data = self.data[self.data['took_meds'] == True]
-                if not med_data.empty:
-                    helped_count = med_data['meds_helped'].sum()
-                    total_count = len(med_data)
-                    effectiveness = helped_count / total_count * 100
-                    
-                    ax.bar(['Helped', 'Did Not Help'], [effectiveness, 100 - effectiveness])
-                    ax.set_title('Medication Effectiveness')
-                    ax.set_ylabel('Percentage')
-                else:
-                    ax.text(0.5, 0.5, 'No medication data available', 
-                           ha='center', va='center', transform=ax.transAxes)
-        
-        plt.tight_layout()
-        
-        # Embed plot in tkinter
-        canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
+            total_count = self._agg["meds_took"]
+            if total_count:
+                effectiveness = self._agg["meds_helped"] / total_count * 100
+                
+                ax.bar(['Helped', 'Did Not Help'], [effectiveness, 100 - effectiveness])
+                ax.set_title('Medication Effectiveness')
+                ax.set_ylabel('Percentage')
+            else:
+                ax.text(0.5, 0.5, 'No medication data available', 
+                       ha='center', va='center', transform=ax.transAxes)
+        
+        self._fig.tight_layout()
+        self._canvas.draw_idle()
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -1,10 +1,10 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
 from datetime import datetime
-from supabase import create_client, Client
-import json
+from supabase import create_client, Client, ClientOptions
+import httpx
+
+# pandas is imported inside the functions that use it so the login page
+# doesn't pay its import cost
 
 # Page configuration
 st.set_page_config(
@@ -20,13 +20,35 @@ def init_supabase():
     try:
         url = st.secrets["SUPABASE_URL"]
         key = st.secrets["SUPABASE_KEY"]
-        return create_client(url, key)
+        # Share one keep-alive connection pool across all requests to skip repeated TLS handshakes.
+        # httpx already sends Accept-Encoding: gzip and transparently decompresses responses;
+        # retries=1 retries a failed connection attempt (TCP connect or TLS handshake) once;
+        # requests already sent on a pooled connection are not retried.
+        transport = httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20, keepalive_expiry=30),
+            retries=1
+        )
+        http_client = httpx.Client(transport=transport, timeout=10.0, follow_redirects=True)
+        return create_client(url, key, options=ClientOptions(httpx_client=http_client))
     except KeyError:
         st.error("❌ Supabase credentials not configured. Please set up secrets in Streamlit Cloud.")
         st.stop()
 
 supabase: Client = init_supabase()
 
+# Columns the app reads back; user_id is implied by the query filter
+ENTRY_COLUMNS = [
+    'id', 'created_at', 'food_source', 'eating_location', 
+    'anxiety_level', 'breathing_difficulty', 'swallowing_difficulty', 
+    'scratchy_throat', 'stomach_pain', 'chest_pain', 'reflux', 
+    'food_eaten', 'concerns', 'additional_comments', 'took_meds', 
+    'med_types', 'meds_helped'
+]
+SEVERITY_OPTIONS = ("None", "Mild", "Moderate", "Severe")
+SEVERITY_COLS = ['breathing_difficulty', 'swallowing_difficulty', 'scratchy_throat', 
+                 'stomach_pain', 'chest_pain', 'reflux']
+
 def check_authentication():
     """Handle user authentication"""
     
@@ -99,30 +121,81 @@ def check_authentication():
     
     return False
 
-def load_user_data():
-    """Load data for the current user from Supabase"""
+def set_column_dtypes(df):
+    """Parse created_at, store severities and food/location as categoricals, med flags as bool and anxiety as Int8"""
+    import pandas as pd
+    
+    df['created_at'] = pd.to_datetime(df['created_at'], utc=True, format='ISO8601', cache=True)
+    severity_dtype = pd.CategoricalDtype(SEVERITY_OPTIONS, ordered=True)
+    for col in SEVERITY_COLS:
+        # Missing or unknown severities mean no symptom
+        df[col] = df[col].astype(severity_dtype).fillna("None")
+    for col in ('food_source', 'eating_location'):
+        df[col] = df[col].astype('category')
+    for col in ('took_meds', 'meds_helped'):
+        df[col] = df[col].fillna(False).astype(bool)
+    # Nullable, so a row with no anxiety level is skipped by the means instead of failing the load
+    df['anxiety_level'] = df['anxiety_level'].astype('Int8')
+    return df
+
+@st.cache_data(ttl=60, max_entries=200, show_spinner=False)
+def fetch_user_entries(user_id, data_version):
+    """Fetch a user's entries; data_version is bumped on every write to invalidate the cache"""
+    import pandas as pd
+    
+    response = supabase.table('food_anxiety_entries').select(','.join(ENTRY_COLUMNS)).eq('user_id', user_id).order('created_at', desc=True).execute()
+    
+    if not response.data:
+        # No entries yet; callers branch on None instead of an empty frame
+        return None
+    return set_column_dtypes(pd.DataFrame(response.data))
+
+@st.cache_data(ttl=60, max_entries=200, show_spinner=False)
+def count_user_entries(user_id, data_version):
+    """Count a user's entries without fetching any rows"""
+    response = supabase.table('food_anxiety_entries').select('id', count='exact', head=True).eq('user_id', user_id).execute()
+    return response.count or 0
+
+PAGE_SIZE = 50
+
+@st.cache_data(ttl=60, max_entries=200, show_spinner=False)
+def fetch_entries_page(user_id, data_version, cursor):
+    """Fetch one page of entries older than the (created_at, id) cursor, newest first"""
+    import pandas as pd
+    
+    query = supabase.table('food_anxiety_entries').select(','.join(ENTRY_COLUMNS)).eq('user_id', user_id)
+    if cursor:
+        # id breaks ties between entries that share a created_at (e.g. inserted in one transaction)
+        created_at, entry_id = cursor
+        query = query.or_(f'created_at.lt."{created_at}",and(created_at.eq."{created_at}",id.lt.{entry_id})')
+    response = query.order('created_at', desc=True).order('id', desc=True).limit(PAGE_SIZE).execute()
+    df = pd.DataFrame(response.data or [], columns=ENTRY_COLUMNS)
+    df['created_at'] = pd.to_datetime(df['created_at'], utc=True, format='ISO8601', cache=True)
+    return df
+
+@st.cache_resource
+def data_versions():
+    """Per-user write counters shared by every session, so cache keys never repeat across logins or tabs"""
+    return {}
+
+def current_data_version():
+    """Version of the current user's entries, used as a cache key"""
+    return data_versions().get(st.session_state.user.id, 0)
+
+def bump_data_version():
+    """Invalidate the current user's cached entries after a write"""
+    versions = data_versions()
+    user_id = st.session_state.user.id
+    versions[user_id] = versions.get(user_id, 0) + 1
+
+def load_user_stats():
+    """Load aggregates for the current user's entries, or None if there are none"""
     try:
         user_id = st.session_state.user.id
-        response = supabase.table('food_anxiety_entries').select('*').eq('user_id', user_id).order('created_at', desc=True).execute()
-        
-        if response.data:
-            df = pd.DataFrame(response.data)
-            # Convert created_at to timestamp for compatibility
-            df['timestamp'] = df['created_at']
-            return df
-        else:
-            # Return empty DataFrame with expected columns
-            columns = [
-                'id', 'user_id', 'created_at', 'timestamp', 'food_source', 'eating_location', 
-                'anxiety_level', 'breathing_difficulty', 'swallowing_difficulty', 
-                'scratchy_throat', 'stomach_pain', 'chest_pain', 'reflux', 
-                'food_eaten', 'concerns', 'additional_comments', 'took_meds', 
-                'med_types', 'meds_helped'
-            ]
-            return pd.DataFrame(columns=columns)
+        return compute_entry_stats(user_id, current_data_version())
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
-        return pd.DataFrame()
+        return None
 
 def save_entry(entry_data):
     """Save a new entry to Supabase"""
@@ -133,6 +206,7 @@ def save_entry(entry_data):
         response = supabase.table('food_anxiety_entries').insert(entry_data).execute()
         
         if response.data:
+            bump_data_version()
             return True
         else:
             return False
@@ -140,19 +214,60 @@ def save_entry(entry_data):
         st.error(f"Error saving entry: {str(e)}")
         return False
 
-def delete_entry(entry_id):
-    """Delete an entry from Supabase"""
+def delete_entries(entry_ids):
+    """Delete several entries from Supabase in a single request"""
     try:
-        response = supabase.table('food_anxiety_entries').delete().eq('id', entry_id).execute()
+        user_id = st.session_state.user.id
+        response = supabase.table('food_anxiety_entries').delete().in_('id', entry_ids).eq('user_id', user_id).execute()
+        bump_data_version()
         return True
     except Exception as e:
-        st.error(f"Error deleting entry: {str(e)}")
+        st.error(f"Error deleting entries: {str(e)}")
         return False
 
-def severity_to_numeric(severity):
-    """Convert severity text to numeric value"""
-    mapping = {"None": 0, "Mild": 1, "Moderate": 2, "Severe": 3}
-    return mapping.get(severity, 0)
+@st.cache_data(ttl=60, max_entries=200, show_spinner=False)
+def compute_entry_stats(user_id, data_version):
+    """Aggregate a user's entries for the charts and summary metrics once per data version"""
+    data = fetch_user_entries(user_id, data_version)
+    if data is None:
+        return None
+    stats = {'severity': {}, 'food_anxiety': {}, 'med_effectiveness': None}
+    stats['timeline'] = data.set_index('created_at')['anxiety_level']
+    
+    for symptom in SEVERITY_COLS:
+        if symptom in data.columns:
+            # Category codes are the numeric severity (None=0 ... Severe=3)
+            stats['severity'][symptom.replace('_', ' ').title()] = data[symptom].cat.codes.mean()
+    
+    if 'food_source' in data.columns and 'anxiety_level' in data.columns:
+        stats['food_anxiety'] = data.groupby('food_source', observed=True)['anxiety_level'].mean().to_dict()
+    
+    if 'took_meds' in data.columns and 'meds_helped' in data.columns:
+        med_data = data[data['took_meds']]
+        if not med_data.empty:
+            stats['med_effectiveness'] = med_data['meds_helped'].sum() / len(med_data) * 100
+    
+    stats['summary'] = {
+        'total': len(data),
+        'avg_anxiety': data['anxiety_level'].mean(),
+        'meds_taken': int(data['took_meds'].sum()),
+        'home_pct': (data['food_source'] == 'Home').mean() * 100
+    }
+    
+    return stats
+
+@st.cache_data(ttl=60, max_entries=200, show_spinner=False)
+def build_export_csv(user_id, data_version):
+    """Serialize a user's entries to CSV bytes once per data version"""
+    import pandas as pd
+    
+    data = fetch_user_entries(user_id, data_version)
+    if data is None:
+        # Everything was deleted before the click; export just the header
+        data = pd.DataFrame(columns=ENTRY_COLUMNS)
+    # Remove internal fields
+    export_data = data.drop(columns=['id', 'user_id'], errors='ignore')
+    return export_data.to_csv(index=False).encode()
 
 def main():
     # Check authentication first
@@ -163,9 +278,6 @@ def main():
     st.title("🍽️ Food Anxiety Tracker")
     st.markdown(f"Welcome back, {st.session_state.user.email}!")
     
-    # Load user data
-    data = load_user_data()
-    
     # Sidebar for navigation
     st.sidebar.title("Navigation")
     page = st.sidebar.radio("Go to", ["Data Entry", "Visualizations", "Data Management"])
@@ -182,15 +294,16 @@ def main():
         except Exception as e:
             st.error(f"Logout error: {str(e)}")
     
-    # Page routing
+    # Page routing; only the pages that read entries load them
     if page == "Data Entry":
-        data_entry_page(data)
+        data_entry_page()
     elif page == "Visualizations":
-        visualizations_page(data)
+        visualizations_page()
     elif page == "Data Management":
-        data_management_page(data)
+        data_management_page()
 
-def data_entry_page(data):
+@st.fragment
+def data_entry_page():
     st.header("📝 Data Entry")
     
     with st.form("anxiety_form"):
@@ -214,19 +327,17 @@ def data_entry_page(data):
         anxiety_level = st.slider("Rank your current anxiety level", 0, 10, 0)
         
         st.subheader("Physical Symptoms")
-        severity_options = ["None", "Mild", "Moderate", "Severe"]
-        
         col1, col2 = st.columns(2)
         
         with col1:
-            breathing_difficulty = st.selectbox("Difficulty catching breath?", severity_options)
-            swallowing_difficulty = st.selectbox("Difficulty swallowing?", severity_options)
-            scratchy_throat = st.selectbox("Scratchy Throat?", severity_options)
+            breathing_difficulty = st.selectbox("Difficulty catching breath?", SEVERITY_OPTIONS)
+            swallowing_difficulty = st.selectbox("Difficulty swallowing?", SEVERITY_OPTIONS)
+            scratchy_throat = st.selectbox("Scratchy Throat?", SEVERITY_OPTIONS)
         
         with col2:
-            stomach_pain = st.selectbox("Stomach pain?", severity_options)
-            chest_pain = st.selectbox("Chest pain?", severity_options)
-            reflux = st.selectbox("Reflux?", severity_options)
+            stomach_pain = st.selectbox("Stomach pain?", SEVERITY_OPTIONS)
+            chest_pain = st.selectbox("Chest pain?", SEVERITY_OPTIONS)
+            reflux = st.selectbox("Reflux?", SEVERITY_OPTIONS)
         
         st.subheader("Food Details")
         food_eaten = st.text_area("What did you eat? Where was it from?", height=100)
@@ -282,200 +393,145 @@ def data_entry_page(data):
             if save_entry(entry_data):
                 st.success("✅ Entry submitted successfully!")
                 st.balloons()
-                st.rerun()
             else:
                 st.error("❌ Failed to save entry. Please try again.")
 
-def visualizations_page(data):
+@st.fragment
+def visualizations_page():
+    import pandas as pd
+    
     st.header("📊 Visualizations")
     
-    if data.empty:
+    stats = load_user_stats()
+    if stats is None:
         st.warning("No data available. Please enter some data first.")
         return
     
-    # Convert timestamp to datetime
-    if 'timestamp' in data.columns:
-        data['timestamp'] = pd.to_datetime(data['timestamp'])
-    
     # Visualization selector
     viz_type = st.selectbox(
         "Select Visualization Type:",
         ["Anxiety Over Time", "Symptom Severity", "Food Source Analysis", "Medication Effectiveness"]
     )
     
-    fig, ax = plt.subplots(figsize=(12, 6))
-    
+    # Native charts send the data to the browser's Vega-Lite renderer instead of a server-side PNG
     if viz_type == "Anxiety Over Time":
-        if len(data) > 1:
-            ax.plot(data['timestamp'], data['anxiety_level'], marker='o', linewidth=2, markersize=8)
-            ax.set_title('Anxiety Level Over Time', fontsize=16, fontweight='bold')
-            ax.set_xlabel('Time', fontsize=12)
-            ax.set_ylabel('Anxiety Level (0-10)', fontsize=12)
-            ax.grid(True, alpha=0.3)
-            ax.set_ylim(0, 10)
-            plt.xticks(rotation=45)
+        if stats['summary']['total'] > 1:
+            st.subheader("Anxiety Level Over Time")
+            st.line_chart(stats['timeline'], x_label="Time", y_label="Anxiety Level (0-10)")
         else:
-            ax.text(0.5, 0.5, 'Need at least 2 data points for time series', 
-                   ha='center', va='center', transform=ax.transAxes, fontsize=14)
+            st.info("Need at least 2 data points for time series")
     
     elif viz_type == "Symptom Severity":
-        symptoms = ['breathing_difficulty', 'swallowing_difficulty', 'scratchy_throat', 
-                   'stomach_pain', 'chest_pain', 'reflux']
-        
-        severity_data = {}
-        for symptom in symptoms:
-            if symptom in data.columns:
-                numeric_values = data[symptom].apply(severity_to_numeric)
-                severity_data[symptom.replace('_', ' ').title()] = numeric_values.mean()
-        
-        if severity_data:
-            bars = ax.bar(severity_data.keys(), severity_data.values(), 
-                         color=['#ff6b6b', '#4ecdc4', '#45b7d1', '#96ceb4', '#ffeaa7', '#dda0dd'])
-            ax.set_title('Average Symptom Severity', fontsize=16, fontweight='bold')
-            ax.set_ylabel('Average Severity (0-3)', fontsize=12)
-            ax.set_ylim(0, 3)
-            plt.xticks(rotation=45)
-            
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height + 0.05,
-                       f'{height:.1f}', ha='center', va='bottom')
+        if stats['severity']:
+            st.subheader("Average Symptom Severity")
+            st.bar_chart(pd.Series(stats['severity']), y_label="Average Severity (0-3)")
     
     elif viz_type == "Food Source Analysis":
-        if 'food_source' in data.columns and 'anxiety_level' in data.columns:
-            food_anxiety = data.groupby('food_source')['anxiety_level'].mean()
-            bars = ax.bar(food_anxiety.index, food_anxiety.values, 
-                         color=['#ff6b6b', '#4ecdc4'])
-            ax.set_title('Average Anxiety by Food Source', fontsize=16, fontweight='bold')
-            ax.set_ylabel('Average Anxiety Level', fontsize=12)
-            ax.set_ylim(0, 10)
-            
-            # Add value labels on bars
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                       f'{height:.1f}', ha='center', va='bottom')
+        if stats['food_anxiety']:
+            st.subheader("Average Anxiety by Food Source")
+            st.bar_chart(pd.Series(stats['food_anxiety']), y_label="Average Anxiety Level")
     
     elif viz_type == "Medication Effectiveness":
-        if 'took_meds' in data.columns and 'meds_helped' in data.columns:
-            med_data = data[data['took_meds'] == True]
-            if not med_data.empty:
-                helped_count = med_data['meds_helped'].sum()
-                total_count = len(med_data)
-                effectiveness = helped_count / total_count * 100
-                
-                bars = ax.bar(['Helped', 'Did Not Help'], 
-                             [effectiveness, 100 - effectiveness],
-                             color=['#4ecdc4', '#ff6b6b'])
-                ax.set_title('Medication Effectiveness', fontsize=16, fontweight='bold')
-                ax.set_ylabel('Percentage', fontsize=12)
-                ax.set_ylim(0, 100)
-                
-                # Add value labels on bars
-                for bar in bars:
-                    height = bar.get_height()
-                    ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                           f'{height:.1f}%', ha='center', va='bottom')
-            else:
-                ax.text(0.5, 0.5, 'No medication data available', 
-                       ha='center', va='center', transform=ax.transAxes, fontsize=14)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
+        effectiveness = stats['med_effectiveness']
+        if effectiveness is not None:
+            st.subheader("Medication Effectiveness")
+            st.bar_chart(pd.Series({'Helped': effectiveness, 'Did Not Help': 100 - effectiveness}), 
+                         y_label="Percentage")
+        else:
+            st.info("No medication data available")
     
     # Display summary statistics
     st.subheader("📈 Summary Statistics")
     col1, col2, col3, col4 = st.columns(4)
     
+    summary = stats['summary']
     with col1:
-        st.metric("Total Entries", len(data))
+        st.metric("Total Entries", summary['total'])
     
     with col2:
-        if not data.empty and 'anxiety_level' in data.columns:
-            avg_anxiety = data['anxiety_level'].mean()
-            st.metric("Average Anxiety", f"{avg_anxiety:.1f}")
+        st.metric("Average Anxiety", f"{summary['avg_anxiety']:.1f}")
     
     with col3:
-        if not data.empty and 'took_meds' in data.columns:
-            med_usage = (data['took_meds'] == True).sum()
-            st.metric("Times Meds Taken", med_usage)
+        st.metric("Times Meds Taken", summary['meds_taken'])
     
     with col4:
-        if not data.empty and 'food_source' in data.columns:
-            home_percentage = (data['food_source'] == 'Home').mean() * 100
-            st.metric("Home Food %", f"{home_percentage:.1f}%")
+        st.metric("Home Food %", f"{summary['home_pct']:.1f}%")
 
-def data_management_page(data):
+@st.fragment
+def data_management_page():
     st.header("🗂️ Data Management")
     
-    if data.empty:
+    try:
+        total = count_user_entries(st.session_state.user.id, current_data_version())
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        return
+    
+    if not total:
         st.info("No data available.")
         return
     
     st.subheader("Data Overview")
-    st.write(f"Total entries: {len(data)}")
+    st.write(f"Total entries: {total}")
     
     # Display recent entries with delete option
     st.subheader("Your Entries")
-    if not data.empty and 'id' in data.columns:
-        # Sort by timestamp (most recent first)
-        if 'created_at' in data.columns:
-            display_data = data.sort_values('created_at', ascending=False)
-        else:
-            display_data = data
-        
-        # Show entries with delete buttons
-        for idx, row in display_data.iterrows():
-            # Create timestamp display
-            if 'created_at' in row and pd.notna(row['created_at']):
-                timestamp_str = pd.to_datetime(row['created_at']).strftime('%Y-%m-%d %H:%M')
+    # Keyset pagination: each page starts below the oldest (created_at, id) of the previous one
+    if 'page_cursors' not in st.session_state:
+        st.session_state.page_cursors = [None]
+    cursors = st.session_state.page_cursors
+    try:
+        display_data = fetch_entries_page(st.session_state.user.id, 
+                                          current_data_version(), cursors[-1])
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        return
+    
+    # Show entries in one table; selected rows are deleted together
+    display_cols = [c for c in ['created_at', 'food_source', 'eating_location', 'anxiety_level', 
+                                'food_eaten', 'concerns'] if c in display_data.columns]
+    event = st.dataframe(
+        display_data[display_cols],
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="multi-row",
+        # The data version in the key resets the selection once entries are deleted
+        key=f"entries_table_{current_data_version()}_{len(cursors)}"
+    )
+    
+    rows = [r for r in event.selection.rows if r < len(display_data)]
+    selected_ids = display_data['id'].iloc[rows].dropna()
+    if not selected_ids.empty:
+        if st.button(f"🗑️ Delete {len(selected_ids)} selected"):
+            if delete_entries([int(i) for i in selected_ids]):
+                st.success("Entries deleted!")
+                st.rerun()
             else:
-                timestamp_str = "Unknown time"
-            
-            # Create anxiety display
-            anxiety_str = f"{row['anxiety_level']}/10" if 'anxiety_level' in row and pd.notna(row['anxiety_level']) else "N/A"
-            
-            with st.expander(f"Entry from {timestamp_str} - Anxiety: {anxiety_str}"):
-                col1, col2 = st.columns([4, 1])
-                
-                with col1:
-                    if 'food_source' in row:
-                        st.write(f"**Food Source:** {row['food_source']}")
-                    if 'eating_location' in row:
-                        st.write(f"**Eating Location:** {row['eating_location']}")
-                    if 'anxiety_level' in row:
-                        st.write(f"**Anxiety Level:** {row['anxiety_level']}/10")
-                    if 'food_eaten' in row and row['food_eaten']:
-                        st.write(f"**Food Eaten:** {row['food_eaten']}")
-                    if 'concerns' in row and row['concerns']:
-                        st.write(f"**Concerns:** {row['concerns']}")
-                
-                with col2:
-                    if 'id' in row and pd.notna(row['id']):
-                        if st.button(f"🗑️ Delete", key=f"delete_{row['id']}"):
-                            if delete_entry(row['id']):
-                                st.success("Entry deleted!")
-                                st.rerun()
-                            else:
-                                st.error("Failed to delete entry")
-                    else:
-                        st.write("Cannot delete - no ID")
-    elif not data.empty:
-        st.warning("Data exists but missing ID column. This might be old CSV data.")
+                st.error("Failed to delete entries")
+    
+    # Callbacks update the cursor stack before the fragment reruns
+    has_older = len(display_data) == PAGE_SIZE
+    col1, col2, col3 = st.columns([1, 1, 4])
+    with col1:
+        st.button("⬅️ Newer", disabled=len(cursors) == 1, on_click=cursors.pop)
+    with col2:
+        st.button("Older ➡️", disabled=not has_older, on_click=cursors.append,
+                  args=((display_data['created_at'].iloc[-1].isoformat(), int(display_data['id'].iloc[-1]))
+                        if has_older else None,))
+    with col3:
+        st.caption(f"Page {len(cursors)}")
     
     # Data export
     st.subheader("Export Data")
-    if not data.empty:
-        # Prepare data for export (remove internal fields)
-        export_data = data.drop(columns=['id', 'user_id'], errors='ignore')
-        csv = export_data.to_csv(index=False)
-        st.download_button(
-            label="📥 Download Your Data (CSV)",
-            data=csv,
-            file_name=f"food_anxiety_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv"
-        )
+    # Only serialize when the button is clicked
+    user_id = st.session_state.user.id
+    data_version = current_data_version()
+    st.download_button(
+        label="📥 Download Your Data (CSV)",
+        data=lambda: build_export_csv(user_id, data_version),
+        file_name=f"food_anxiety_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+        mime="text/csv"
+    )
 
 if __name__ == "__main__":
     main()
\ No newline at end of file